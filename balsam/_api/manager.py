@@ -161,6 +161,8 @@ class Manager(Generic[T]):
     def _fetch_pages(
         self, filters: Dict[str, Any], ordering: Optional[str], limit: Optional[int], offset: Optional[int]
     ) -> Tuple[int, List[Dict[str, Any]]]:
+        # Pages are fetched with limit/offset: the REST API exposes no generic
+        # `{field}__gt` filters, so keyset pagination cannot be done client-side.
         base_offset = 0 if offset is None else offset
         page_size = MAX_PAGE_SIZE if limit is None else min(limit, MAX_PAGE_SIZE)
 
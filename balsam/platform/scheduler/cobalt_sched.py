@@ -22,6 +22,9 @@ PathLike = Union[Path, str]
 
 logger = logging.getLogger(__name__)
 
+# Cobalt log timestamp lines look like "Thu Aug 08 13:37:48 2019 +0000 (UTC)"
+_LOG_DATE_FORMAT = "%a %b %d %H:%M:%S %Y %z"
+
 
 def parse_cobalt_time_minutes(t_str: str) -> int:
     try:
@@ -282,8 +285,12 @@ class CobaltScheduler(SubprocessSchedulerInterface):
 
     @staticmethod
     def _parse_time(line: str) -> datetime:
-        time_str = line[: line.find("(UTC)")]
-        return dateutil.parser.parse(time_str)
+        time_str = line[: line.find("(UTC)")].strip()
+        try:
+            return datetime.strptime(time_str, _LOG_DATE_FORMAT)
+        except ValueError:
+            # Fall back to the general-purpose parser on unexpected formats
+            return dateutil.parser.parse(time_str)
 
     @staticmethod
     def _parse_logs(scheduler_id: int, job_script_path: Optional[PathLike]) -> SchedulerJobLog:
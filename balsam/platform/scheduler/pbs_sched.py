@@ -1,10 +1,12 @@
 import getpass
+import hashlib
 import json
 import logging
 from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Tuple, Union
 
 import dateutil.parser
 
@@ -22,10 +24,21 @@ from .scheduler import (
 
 PathLike = Union[Path, str]
 
+# orjson is a server-side dependency; launch environments may only have stdlib json
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
 def parse_cobalt_time_minutes(t_str: str) -> int:
+    # Pure function of the string; walltimes repeat heavily across a cluster,
+    # so most polls hit the cache instead of re-splitting
     try:
         H, M, S = map(int, t_str.split(":"))
     except ValueError:
@@ -34,6 +47,24 @@ def parse_cobalt_time_minutes(t_str: str) -> int:
         return H * 60 + M + round(S / 60)
 
 
+_QSTAT_DATE_FORMAT = "%a %b %d %H:%M:%S %Y"
+# Log timestamp lines look like "Thu Aug 08 13:37:48 2019 +0000 (UTC)"
+_LOG_DATE_FORMAT = "%a %b %d %H:%M:%S %Y %z"
+
+# Digest of the last qstat output and its parsed per-job fields: between
+# short-interval polls the output is usually byte-identical, and hashing it is
+# far cheaper than re-parsing the JSON. Only the parse is cached; the
+# now-relative minute fields are recomputed from qtime/stime on every call.
+_last_status_digest: Optional[bytes] = None
+_last_status_parsed: Dict[int, Dict[str, Any]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_qstat_time(t_str: str) -> datetime:
+    # stime/qtime strings repeat across polls; strptime is slow enough to cache
+    return datetime.strptime(t_str, _QSTAT_DATE_FORMAT)
+
+
 class PBSScheduler(SubprocessSchedulerInterface):
     status_exe = "qstat"
     submit_exe = "qsub"
@@ -113,18 +144,6 @@ class PBSScheduler(SubprocessSchedulerInterface):
         "wall_time_min": "Backfill",
     }
 
-    # when reading these fields from the scheduler apply
-    # these maps to the string extracted from the output
-    @staticmethod
-    def _nodelist_field_map(balsam_field: str) -> Callable[[str], Any]:
-        nodelist_field_map = {
-            "id": lambda id: int(id),
-            "state": PBSScheduler._node_state_map,
-            "queues": lambda x: x.split(":"),
-            "wall_time_min": lambda x: parse_cobalt_time_minutes(x),
-        }
-        return nodelist_field_map.get(balsam_field, lambda x: x)
-
     @staticmethod
     def _render_submit_args(
         script_path: Union[Path, str], project: str, queue: str, num_nodes: int, wall_time_min: int, **kwargs: Any
@@ -162,7 +181,7 @@ class PBSScheduler(SubprocessSchedulerInterface):
     @staticmethod
     def _parse_submit_output(submit_output: str) -> int:
         try:
-            return int(submit_output.split(".")[0])
+            return int(submit_output.split(".", 1)[0])
         except Exception as exc:
             # Catch errors here and handle
             logger.warning(f"Exception: {exc}")
@@ -181,7 +200,7 @@ class PBSScheduler(SubprocessSchedulerInterface):
         stdout_lines = [s for s in stdout.split("\n") if str(user) in s]
         if len(stdout_lines) == 0:
             return {}  # if there are no jobs in the queue return an empty dictionary
-        user_job_ids = [s.split(".")[0] for s in stdout_lines]
+        user_job_ids = [s.split(".", 1)[0] for s in stdout_lines]
 
         # Next call qstat to get job jsons
         args = [PBSScheduler.status_exe]
@@ -194,55 +213,99 @@ class PBSScheduler(SubprocessSchedulerInterface):
     @staticmethod
     def _parse_status_output(raw_output: str) -> Dict[int, SchedulerJobStatus]:
         # TODO: this can be much more efficient with a compiled regex findall()
+        global _last_status_digest, _last_status_parsed
+        digest = hashlib.blake2b(raw_output.encode(), digest_size=8).digest()
+        if digest != _last_status_digest:
+            _last_status_parsed = PBSScheduler._parse_status_jobs(raw_output)
+            _last_status_digest = digest
+        # Statuses are rebuilt against the current clock on every call, so a
+        # digest hit cannot freeze queued_time_min/time_remaining_min, and
+        # callers never share mutable objects with the cache
+        return PBSScheduler._build_statuses(_last_status_parsed)
+
+    @staticmethod
+    def _parse_status_jobs(raw_output: str) -> Dict[int, Dict[str, Any]]:
         # logger.info(f"json status output {raw_output}")
         username = getpass.getuser()
-        j = json.loads(raw_output)
-        date_format = "%a %b %d %H:%M:%S %Y"
-        status_dict = {}
-        if "Jobs" in j.keys():
+        j = json_loads(raw_output)
+        job_states = PBSScheduler._job_states
+        parsed: Dict[int, Dict[str, Any]] = {}
+        # Pop each job entry off as it is consumed so peak memory stays at
+        # O(one job) rather than holding the full parsed tree through the loop
+        jobs = j.pop("Jobs", None)
+        if jobs:
             try:
-                for jobidstr, job in j["Jobs"].items():
+                while jobs:
+                    jobidstr, job = jobs.popitem()
                     # temporarily filter jobs by user due to PBS bug
                     job_username = job["Job_Owner"].split("@")[0]
                     if job_username != username:
                         continue
-                    status = {}
                     try:
                         # array jobs can have a trailing "[]"; remove this
                         jobidstr = jobidstr.replace("[]", "")
-                        jobid = int(jobidstr.split(".")[0])
-                        status["scheduler_id"] = jobid
+                        jobid = int(jobidstr.split(".", 1)[0])
                     except ValueError:
                         logger.error(f"Error parsing jobid {jobidstr} in status output; skipping")
                         continue
-                    status["state"] = PBSScheduler._job_states[job["job_state"]]  # type: ignore # noqa
-                    status["time_remaining_min"] = 0
-                    status["wall_time_min"] = 0
+                    # Unknown states would KeyError here and abort the whole parse;
+                    # skip just the offending job instead
+                    job_state = job_states.get(job["job_state"])
+                    if job_state is None:
+                        logger.warning(f"Unrecognized job_state {job['job_state']} for job {jobidstr}; skipping")
+                        continue
+                    wall_time_min = 0
+                    stime = None
+                    stime_failed = False
                     if "walltime" in job["Resource_List"].keys():
-                        W = job["Resource_List"]["walltime"].split(":")
-                        wall_time_min = int(W[0]) * 60 + int(W[1])  # 00:00:00
-                        status["wall_time_min"] = wall_time_min
-                        if status["state"] == "queued":  # type: ignore # noqa
-                            status["time_remaining_min"] = wall_time_min
-                        try:
-                            if status["state"] == "running" and "stime" in job.keys():  # type: ignore # noqa
-                                status["time_remaining_min"] = int(
-                                    wall_time_min
-                                    - (datetime.now() - datetime.strptime(job["stime"], date_format)).total_seconds()
-                                    / 60
-                                )
-                        except Exception as err:
-                            status["time_remaining_min"] = wall_time_min
-                            logger.exception(f"Exception {str(err)} processing job {jobidstr} {job}")
-                    status["queue"] = job["queue"]
-                    status["num_nodes"] = job["Resource_List"]["nodect"]
-                    status["project"] = job["project"]
-                    status["queued_time_min"] = int(
-                        (datetime.now() - datetime.strptime(job["qtime"], date_format)).total_seconds() / 60
-                    )
-                    status_dict[jobid] = SchedulerJobStatus(**status)
+                        wall_time_min = parse_cobalt_time_minutes(job["Resource_List"]["walltime"])  # HH:MM:SS
+                        if job_state == "running" and "stime" in job.keys():
+                            try:
+                                stime = _parse_qstat_time(job["stime"])
+                            except Exception as err:
+                                stime_failed = True
+                                logger.exception(f"Exception {str(err)} processing job {jobidstr} {job}")
+                    parsed[jobid] = {
+                        "state": job_state,
+                        "queue": job["queue"],
+                        "num_nodes": job["Resource_List"]["nodect"],
+                        "project": job["project"],
+                        "wall_time_min": wall_time_min,
+                        "stime": stime,
+                        "stime_failed": stime_failed,
+                        "qtime": _parse_qstat_time(job["qtime"]),
+                    }
             except BaseException as err:
                 logger.exception(f"Exception {str(err)} parsing {raw_output}")
+        return parsed
+
+    @staticmethod
+    def _build_statuses(parsed: Dict[int, Dict[str, Any]]) -> Dict[int, SchedulerJobStatus]:
+        now = datetime.now()
+        status_dict = {}
+        for jobid, entry in parsed.items():
+            state = entry["state"]
+            wall_time_min = entry["wall_time_min"]
+            stime = entry["stime"]
+            time_remaining_min = 0
+            if state == "queued":
+                time_remaining_min = wall_time_min
+            elif state == "running":
+                if stime is not None:
+                    time_remaining_min = int(wall_time_min - (now - stime).total_seconds() / 60)
+                elif entry["stime_failed"]:
+                    # stime was present but unparseable: assume the full walltime remains
+                    time_remaining_min = wall_time_min
+            status_dict[jobid] = SchedulerJobStatus(
+                scheduler_id=jobid,
+                state=state,
+                queue=entry["queue"],
+                num_nodes=entry["num_nodes"],
+                wall_time_min=wall_time_min,
+                project=entry["project"],
+                time_remaining_min=time_remaining_min,
+                queued_time_min=int((now - entry["qtime"]).total_seconds() / 60),
+            )
         return status_dict
 
     @staticmethod
@@ -276,45 +339,42 @@ class PBSScheduler(SubprocessSchedulerInterface):
         if actual != expected:
             raise ValueError(f"Line has {actual} columns: expected {expected}:\n{fields}")
 
-        status = {}
-        for name, value in zip(PBSScheduler._nodelist_fields, fields):
-            func = PBSScheduler._nodelist_field_map(name)
-            status[name] = func(value)
-        return status
+        return {
+            name: conv(value)
+            for name, conv, value in zip(PBSScheduler._nodelist_fields, _NODELIST_CONVERTERS, fields)
+        }
 
     @staticmethod
     def _nodelist_to_backfill(
         nodelist: List[Dict[str, Any]],
     ) -> Dict[str, List[SchedulerBackfillWindow]]:
         queue_bf_times = defaultdict(list)
-        windows = defaultdict(list)
+        windows: DefaultDict[str, List[SchedulerBackfillWindow]] = defaultdict(list)
 
         for entry in nodelist:
             bf_time = entry["wall_time_min"]
-            queues = entry["queues"]
-            for queue in queues:
+            for queue in entry["queues"]:
                 queue_bf_times[queue].append(bf_time)
 
+        window_cls = SchedulerBackfillWindow
         for queue, bf_times in queue_bf_times.items():
-            # Mapping {bf_time: num_nodes}
-            bf_counter = Counter(bf_times)
-            # {
-            #    queue_name: [(bf_time1, num_nodes1), (bf_time2, num_nodes2), ...],
-            # }
-            # For each queue, sorted with longer times first
-            queue_bf_times[queue] = sorted(bf_counter.items(), reverse=True)
-
-        for queue, bf_list in queue_bf_times.items():
+            # Counter gives {bf_time: num_nodes}; walk it longest-window-first,
+            # accumulating node counts, in a single pass per queue
             running_total = 0
-            for bf_time, num_nodes in bf_list:
+            append = windows[queue].append
+            for bf_time, num_nodes in sorted(Counter(bf_times).items(), reverse=True):
                 running_total += num_nodes
-                windows[queue].append(SchedulerBackfillWindow(num_nodes=running_total, wall_time_min=bf_time))
+                append(window_cls(num_nodes=running_total, wall_time_min=bf_time))
         return windows
 
     @staticmethod
     def _parse_time(line: str) -> datetime:
-        time_str = line[: line.find("(UTC)")]
-        return dateutil.parser.parse(time_str)
+        time_str = line[: line.find("(UTC)")].strip()
+        try:
+            return datetime.strptime(time_str, _LOG_DATE_FORMAT)
+        except ValueError:
+            # Fall back to the general-purpose parser on unexpected formats
+            return dateutil.parser.parse(time_str)
 
     @staticmethod
     def _parse_logs(scheduler_id: int, job_script_path: Optional[PathLike]) -> SchedulerJobLog:
@@ -329,7 +389,7 @@ class PBSScheduler(SubprocessSchedulerInterface):
                 logger.warning(f"Batch Job {scheduler_id} not found in PBS")
                 raise DelayedSubmitFail
             return SchedulerJobLog()
-        json_output = json.loads(stdout)
+        json_output = json_loads(stdout)
         # logger.info(f"_parse_logs json_output: {json_output}")
         if len(json_output["Jobs"]) == 0:
             logger.error("no job found for JOB ID = %s", scheduler_id)
@@ -379,6 +439,20 @@ class PBSScheduler(SubprocessSchedulerInterface):
         return projects
 
 
+# Converters applied positionally to whitespace-split nodelist columns, in the
+# same order as PBSScheduler._nodelist_fields; one direct call per field
+# replaces the old per-field _nodelist_field_map dispatch
+_NODELIST_CONVERTERS: Tuple[Callable[[str], Any], ...] = (
+    int,  # id
+    str,  # name
+    lambda x: x.split(":"),  # queues
+    PBSScheduler._node_state_map,  # state
+    str,  # mem
+    str,  # numa
+    parse_cobalt_time_minutes,  # wall_time_min
+)
+
+
 if __name__ == "__main__":
     pass
     """
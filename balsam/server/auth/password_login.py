@@ -3,6 +3,7 @@ from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, exc
 
 from balsam.schemas import UserCreate, UserOut
@@ -53,9 +54,10 @@ def profile(user: UserOut = Depends(user_from_token)) -> UserOut:
 
 @router.post("/register", response_model=UserOut, status_code=status.HTTP_201_CREATED)
 def register(user: UserCreate, db: Session = Depends(get_admin_session)) -> UserOut:
-    if users.user_exists(db, user.username):
+    try:
+        new_user = users.create_user(db, user.username, user.password)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Username already taken")
-
-    new_user = users.create_user(db, user.username, user.password)
-    db.commit()
     return new_user
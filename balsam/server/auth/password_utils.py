@@ -1,6 +1,8 @@
 from passlib.context import CryptContext  # type: ignore
 
-ctx = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from balsam.server import settings
+
+ctx = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.auth.bcrypt_rounds)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
@@ -50,6 +50,8 @@ class AuthSettings(BaseSettings):
     token_ttl: timedelta = timedelta(hours=48)
     auth_method: str = "user_from_token"
     login_methods: List[LoginMethod] = [LoginMethod.password]
+    # bcrypt work factor for password hashing; lowered in test environments
+    bcrypt_rounds: int = 12
     oauth_provider: Optional[OAuthProviderSettings] = None
 
     @validator("oauth_provider", always=True)
@@ -0,0 +1,30 @@
+"""workdir_trgm_idx
+
+Revision ID: 06ef4802808d
+Revises: f0ef7fd915a1
+Create Date: 2026-08-31 12:04:18.102931
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "06ef4802808d"
+down_revision = "f0ef7fd915a1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_job_workdir_trgm",
+        "jobs",
+        ["workdir"],
+        postgresql_using="GIN",
+        postgresql_ops={"workdir": "gin_trgm_ops"},
+    )
+
+
+def downgrade():
+    op.drop_index("ix_job_workdir_trgm", "jobs")
@@ -4,7 +4,6 @@ from typing import List, Optional, cast
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import exists
 
 from balsam.schemas import UserOut
 from balsam.server.auth.password_utils import get_hash
@@ -17,10 +16,6 @@ def get_user_by_username(db: Session, username: str) -> User:
     return db.query(User).filter(User.username == username).one()
 
 
-def user_exists(db: Session, username: str) -> bool:
-    return bool(db.query(exists().where(User.username == username)).scalar())  # type: ignore
-
-
 def create_user(db: Session, username: str, password: Optional[str]) -> UserOut:
     if password:
         hashed = get_hash(password)
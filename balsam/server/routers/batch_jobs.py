@@ -1,6 +1,7 @@
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import orm
 
 from balsam import schemas
@@ -65,18 +66,20 @@ def update(
     return result
 
 
-@router.patch("/", response_model=List[schemas.BatchJobOut])
+@router.patch("/", response_class=ORJSONResponse)
 def bulk_update(
     batch_jobs: List[schemas.BatchJobBulkUpdate],
     db: orm.Session = Depends(get_webuser_session),
     user: schemas.UserOut = Depends(auth),
-) -> List[schemas.BatchJobOut]:
+) -> ORJSONResponse:
     """Update a list of BatchJobs."""
     updated_batch_jobs = crud.batch_jobs.bulk_update(db, owner=user, batch_jobs=batch_jobs)
-    result = [schemas.BatchJobOut.from_orm(j) for j in updated_batch_jobs]
+    # Validate each row once via from_orm; skip the response_model re-validation
+    # and jsonable_encoder pass by serializing the dicts directly with orjson.
+    result = [schemas.BatchJobOut.from_orm(j).dict() for j in updated_batch_jobs]
     db.commit()
     pubsub.publish(user.id, "bulk-update", "batch_job", result)
-    return result
+    return ORJSONResponse(content=result)
 
 
 @router.delete("/{batch_job_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,7 +1,7 @@
-from typing import Any, Dict
-
+import orjson
 from fastapi import APIRouter, Depends
 from sqlalchemy import orm
+from starlette.responses import Response
 
 from balsam import schemas
 from balsam.server.auth import get_auth_method, get_webuser_session
@@ -14,13 +14,13 @@ router = APIRouter()
 auth = get_auth_method()
 
 
-@router.get("/", response_model=schemas.PaginatedLogEventOut)
+@router.get("/", response_class=Response)
 def list(
     db: orm.Session = Depends(get_webuser_session),
     user: schemas.UserOut = Depends(auth),
     paginator: Paginator[LogEvent] = Depends(Paginator),
     q: EventLogQuery = Depends(EventLogQuery),
-) -> Dict[str, Any]:
+) -> Response:
     """List events associated with the user's Jobs."""
     count, events = crud.events.fetch(db, owner=user, paginator=paginator, filterset=q)
-    return {"count": count, "results": events}
+    return Response(content=orjson.dumps({"count": count, "results": events}), media_type="application/json")
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Set, Tuple, cast, overload
+from typing import Any, Callable, Dict, List, Set, Tuple, overload
 
 from fastapi import Query
 from sqlalchemy import orm
@@ -10,6 +10,16 @@ from balsam import schemas
 from balsam.server.models import App, BatchJob, Job, LogEvent, Session, Site, TransferItem
 
 
+def _split_tags(tags: List[str]) -> Dict[str, str]:
+    """Split a list of colon-delimited KEY:VALUE strings in a single pass."""
+    tags_dict: Dict[str, str] = {}
+    for tag in tags:
+        key, sep, value = tag.partition(":")
+        if sep:
+            tags_dict[key] = value
+    return tags_dict
+
+
 @dataclass
 class SiteQuery:
     name: str = Query(None, description="Fetch the site with this name")
@@ -89,11 +99,9 @@ class EventLogQuery:
         if self.scheduler_id:
             qs = qs.filter(BatchJob.scheduler_id == self.scheduler_id)
         if self.tags:
-            tags_dict: Dict[str, str] = dict(t.split(":", 1) for t in self.tags if ":" in t)
-            qs = qs.filter(Job.tags.contains(tags_dict))  # type: ignore
+            qs = qs.filter(Job.tags.contains(_split_tags(self.tags)))  # type: ignore
         if self.data:
-            data_dict: Dict[str, str] = dict(d.split(":", 1) for d in self.data if ":" in d)
-            qs = qs.filter(LogEvent.data.contains(data_dict))  # type: ignore
+            qs = qs.filter(LogEvent.data.contains(_split_tags(self.data)))  # type: ignore
         if self.timestamp_before:
             qs = qs.filter(LogEvent.timestamp <= self.timestamp_before)
         if self.timestamp_after:
@@ -109,6 +117,36 @@ class EventLogQuery:
         return qs
 
 
+# (attr name, expression builder) pairs for the simple JobQuery filters;
+# the batch_job_id join and ordering are handled separately in apply_filters.
+_JOB_FILTERS: List[Tuple[str, Callable[[Any], Any]]] = [
+    ("id", lambda v: Job.id.in_(v)),
+    ("parent_id", lambda v: Job.parent_ids.overlap(v)),  # type: ignore[attr-defined]
+    ("app_id", lambda v: Job.app_id == v),
+    ("site_id", lambda v: Site.id.in_(v)),
+    ("last_update_before", lambda v: Job.last_update <= v),
+    ("last_update_after", lambda v: Job.last_update >= v),
+    ("workdir__contains", lambda v: Job.workdir.ilike(f"%{v}%")),
+    ("state__ne", lambda v: Job.state != v),
+    ("state", lambda v: Job.state.in_(v)),
+    ("tags", lambda v: Job.tags.contains(_split_tags(v))),  # type: ignore[no-untyped-call]
+    ("pending_file_cleanup", lambda v: Job.pending_file_cleanup),
+]
+
+# JobOrdering is a closed set; prebuild the ORDER BY clauses rather than
+# re-resolving getattr(Job, ...) and asc()/desc() on every request.
+_JOB_ORDER_CLAUSES = {
+    schemas.JobOrdering.last_update: Job.last_update.asc(),
+    schemas.JobOrdering.last_update_desc: Job.last_update.desc(),
+    schemas.JobOrdering.id: Job.id.asc(),
+    schemas.JobOrdering.id_desc: Job.id.desc(),
+    schemas.JobOrdering.state: Job.state.asc(),
+    schemas.JobOrdering.state_desc: Job.state.desc(),
+    schemas.JobOrdering.workdir: Job.workdir.asc(),
+    schemas.JobOrdering.workdir_desc: Job.workdir.desc(),
+}
+
+
 @dataclass
 class JobQuery:
     id: List[int] = Query(None, min_items=1, description="Only return Jobs with ids in this list.")
@@ -137,48 +175,20 @@ class JobQuery:
     def apply_filters(self, qs: "orm.Query[Job]") -> "orm.Query[Job]":  # noqa: C901
         ...
 
-    def apply_filters(self, qs):  # type: ignore[no-untyped-def] # noqa: C901
+    def apply_filters(self, qs):  # type: ignore[no-untyped-def]
         # Overload to work with core "Select.where" or ORM "Query.filter"
-        if isinstance(qs, Select):
-
-            def _filter(expr: Any):  # type: ignore[no-untyped-def]
-                return qs.where(expr)
-
-        else:
-
-            def _filter(expr: Any):  # type: ignore[no-untyped-def]
-                return qs.filter(expr)
-
-        if self.id:
-            qs = _filter(Job.id.in_(self.id))
-        if self.parent_id:
-            qs = _filter(Job.parent_ids.overlap(self.parent_id))  # type: ignore[attr-defined]
-        if self.app_id:
-            qs = _filter(Job.app_id == self.app_id)
-        if self.site_id:
-            qs = _filter(Site.id.in_(self.site_id))
+        is_select = isinstance(qs, Select)
+        for name, build in _JOB_FILTERS:
+            value = getattr(self, name)
+            if value:
+                expr = build(value)
+                qs = qs.where(expr) if is_select else qs.filter(expr)
         if self.batch_job_id:
-            qs = qs.join(BatchJob.__table__ if isinstance(qs, Select) else BatchJob)
-            qs = _filter(BatchJob.id == self.batch_job_id)
-        if self.last_update_before:
-            qs = _filter(Job.last_update <= self.last_update_before)
-        if self.last_update_after:
-            qs = _filter(Job.last_update >= self.last_update_after)
-        if self.workdir__contains:
-            qs = _filter(Job.workdir.like(f"%{self.workdir__contains}%"))
-        if self.state__ne:
-            qs = _filter(Job.state != self.state__ne)
-        if self.state:
-            qs = _filter(Job.state.in_(self.state))
-        if self.tags:
-            tags_dict: Dict[str, str] = dict(t.split(":", 1) for t in self.tags if ":" in t)
-            qs = _filter(Job.tags.contains(tags_dict))  # type: ignore
-        if self.pending_file_cleanup:
-            qs = _filter(Job.pending_file_cleanup)
+            qs = qs.join(BatchJob.__table__ if is_select else BatchJob)
+            expr = BatchJob.id == self.batch_job_id
+            qs = qs.where(expr) if is_select else qs.filter(expr)
         if self.ordering:
-            desc = self.ordering.startswith("-")
-            order_col = getattr(Job, self.ordering.lstrip("-"))
-            qs = qs.order_by(order_col.desc() if desc else order_col)
+            qs = qs.order_by(_JOB_ORDER_CLAUSES[self.ordering])
         return qs
 
 
@@ -210,8 +220,7 @@ class TransferItemQuery:
         if self.job_state:
             qs = qs.filter(Job.state == self.job_state)
         if self.tags:
-            tags_dict = dict(cast(Tuple[str, str], t.split(":", 1)) for t in self.tags if ":" in t)
-            qs = qs.filter(Job.tags.contains(tags_dict))  # type: ignore
+            qs = qs.filter(Job.tags.contains(_split_tags(self.tags)))  # type: ignore
         return qs
 
 
@@ -256,8 +265,7 @@ class BatchJobQuery:
             qs = qs.filter(BatchJob.end_time >= self.end_time_after)
 
         if self.filter_tags:
-            tags_dict: Dict[str, str] = dict(t.split(":", 1) for t in self.filter_tags if ":" in t)
-            qs = qs.filter(BatchJob.filter_tags.contains(tags_dict))  # type: ignore
+            qs = qs.filter(BatchJob.filter_tags.contains(_split_tags(self.filter_tags)))  # type: ignore
         if self.ordering:
             desc = self.ordering.startswith("-")
             order_col = getattr(BatchJob, self.ordering.lstrip("-"))
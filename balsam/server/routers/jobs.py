@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List
 
 import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -72,9 +72,13 @@ def bulk_update(
             status_code=400, detail=f"Cannot bulk-update more than {MAX_ITEMS_PER_BULK_OP} in a single API call."
         )
     now = datetime.utcnow()
-    patch_dicts = {job.id: {**job.dict(exclude_unset=True, exclude={"id"}), "last_update": now} for job in jobs}
-    if len(jobs) > len(patch_dicts):
-        raise ValidationError("Duplicate Job ID keys provided")
+    patch_dicts: Dict[int, Dict[str, Any]] = {}
+    for job in jobs:
+        if job.id in patch_dicts:
+            raise ValidationError("Duplicate Job ID keys provided")
+        patch = job.dict(exclude_unset=True, exclude={"id"})
+        patch["last_update"] = now
+        patch_dicts[job.id] = patch
     num_updated = crud.jobs.bulk_update(db, owner=user, patch_dicts=patch_dicts)
     db.commit()
     return num_updated
@@ -279,20 +279,6 @@ def create_database(new_dbname: str, host: str, port: int, username: str, passwo
         )
 
 
-def connections_list(
-    host: str, port: int, username: str, password: str, database: str = "balsam", **kwargs: Any
-) -> List[str]:
-    with PgCursor(host, port, username, password) as cur:
-        cur.execute(
-            f"""
-        SELECT pid,application_name,usename,state,substr(query, 1, 60) \
-        FROM pg_stat_activity WHERE datname = '{database}';
-        """
-        )
-        conns = cur.fetchall()
-        return list(conns)
-
-
 def create_user_and_pwfile(
     new_user: str,
     host: str,
@@ -337,11 +323,12 @@ def pg_add_user(
     with PgCursor(host, port, username, password) as cur:
         cur.execute(
             f"""
-        CREATE ROLE {new_user} WITH LOGIN PASSWORD '{new_password}'; \
+        CREATE ROLE {new_user} WITH LOGIN PASSWORD %s; \
         grant all privileges on database {database} to {new_user}; \
         GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO {new_user}; \
         GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO {new_user};
-        """
+        """,
+            [new_password],
         )
 
 
@@ -7,6 +7,8 @@ import pytest
 from balsam._api.app import ApplicationDefinition
 from balsam.schemas import TransferItemState
 
+from ..conftest import protect_site, unprotect_site
+
 GeomOpt = None
 AppA = None
 AppB = None
@@ -82,13 +84,29 @@ def appdef_py(client):
     return AppPy
 
 
+@pytest.fixture(scope="class")
+def site_app(session_user_client):
+    """
+    Default (Site, App) pair: the shared preamble for Job/BatchJob/Session tests.
+    Created once per test class; the `client` teardown wipes per-test Jobs,
+    Sessions and BatchJobs but leaves this Site in place until class teardown.
+    """
+    client = session_user_client
+    site = client.Site.objects.create(name="theta", path="/projects/foo")
+    app = client.App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+    protect_site(site.id)
+    yield site, app
+    unprotect_site(site.id)
+    site.delete()
+
+
 class TestSite:
     def test_create_and_list(self, client):
         Site = client.Site
-        assert len(Site.objects.all()) == 0
+        assert Site.objects.count() == 0
         s1 = Site.objects.create(name="theta", path="/projects/foo")
         s2 = Site.objects.create(name="cooley", path="/projects/bar")
-        assert len(Site.objects.all()) == 2
+        assert Site.objects.count() == 2
         assert s1.id is not None
         assert "foo" in s1.path.as_posix()
         assert "bar" in s2.path.as_posix()
@@ -134,7 +152,7 @@ class TestSite:
         Site.objects.create(name="theta", path="/projects/foo")
         tempsite = Site.objects.create(name="cooley", path="/projects/bar")
         assert tempsite.id is not None
-        assert len(Site.objects.all()) == 2
+        assert Site.objects.count() == 2
 
         tempsite.delete()
         assert tempsite.id is None
@@ -148,11 +166,8 @@ class TestSite:
         Site.objects.create(name="thetalogin4.alcf.anl.gov", path="/projects/bar")
         Site.objects.create(name="cooley", path="/projects/baz")
 
-        cooley_only = Site.objects.filter(name="cooley")
-        assert len(cooley_only) == 1
-
-        theta_substr = Site.objects.filter(name="theta")
-        assert len(theta_substr) == 0
+        assert Site.objects.filter(name="cooley").count() == 1
+        assert Site.objects.filter(name="theta").count() == 0
 
     def test_get_by_id_returns_match(self, client):
         Site = client.Site
@@ -197,14 +212,14 @@ class TestApps:
     def test_create_and_list(self, client, appdef):
         App = client.App
         Site = client.Site
-        assert len(App.objects.all()) == 0
+        assert App.objects.count() == 0
 
         mysite = Site.objects.create(name="theta", path="/projects/foo")
         GeomOpt = appdef
         GeomOpt.site = mysite
         assert GeomOpt.__app_id__ is None
         GeomOpt.sync()
-        assert len(App.objects.all()) == 1
+        assert App.objects.count() == 1
         assert GeomOpt.__app_id__ is not None
 
     def test_get_by_id(self, client, appdef):
@@ -275,7 +290,7 @@ class TestJobs:
         App = client.App
         Site = client.Site
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
+        site = Site.objects.create(name="summit", path="/projects/foo")
         app = App.objects.create(
             site_id=site.id,
             name="one",
@@ -293,7 +308,7 @@ class TestJobs:
     def test_create_using_app_name(self, client, appdef):
         Site = client.Site
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
+        site = Site.objects.create(name="summit", path="/projects/foo")
         GeomOpt = appdef
         GeomOpt.site = site
         GeomOpt.sync()
@@ -307,7 +322,7 @@ class TestJobs:
 
     def test_create_using_app_submit_method(self, client, appdef):
         Site = client.Site
-        site = Site.objects.create(name="theta", path="/projects/foo")
+        site = Site.objects.create(name="summit", path="/projects/foo")
         GeomOpt = appdef
         GeomOpt.site = site
         GeomOpt.sync()
@@ -318,12 +333,9 @@ class TestJobs:
         assert job.app_id == GeomOpt.__app_id__
         assert job.state == "STAGED_IN"
 
-    def test_set_and_fetch_data(self, client):
-        App = client.App
-        Site = client.Site
+    def test_set_and_fetch_data(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
 
         job = Job.objects.create("test/run1", app_id=app.id)
         assert job.id is not None
@@ -333,12 +345,9 @@ class TestJobs:
         retrieved = Job.objects.get(id=job.id)
         assert retrieved.data == {"foo": 1234}
 
-    def test_update_data(self, client):
-        App = client.App
-        Site = client.Site
+    def test_update_data(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
         job = Job.objects.create("test/run1", app_id=app.id, data={"foo": 1234}, num_nodes=1)
 
         # Correct way to update a mutable field:
@@ -355,12 +364,9 @@ class TestJobs:
         job.refresh_from_db()
         assert "baz" not in job.data
 
-    def test_order_limit_offset(self, client):
-        App = client.App
-        Site = client.Site
+    def test_order_limit_offset(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
         jobs = [Job(f"test/{i}", app_id=app.id) for i in range(8)]
         random.shuffle(jobs)
         Job.objects.bulk_create(jobs)
@@ -378,12 +384,9 @@ class TestJobs:
         assert len(subset) == 2
         assert set(job.workdir.as_posix() for job in subset) == {"test/5", "test/6"}
 
-    def test_bulk_create_and_update(self, client):
-        App = client.App
-        Site = client.Site
+    def test_bulk_create_and_update(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
         jobs = [Job(f"test/{i}", app_id=app.id) for i in range(10)]
 
         jobs = Job.objects.bulk_create(jobs)
@@ -397,20 +400,18 @@ class TestJobs:
 
         Job.objects.bulk_update(jobs)
 
-        # Jobs appear updated in fresh query:
-        for job in Job.objects.all():
+        # Jobs appear updated in fresh query; state predicate checked server-side:
+        updated = list(Job.objects.filter(state="PREPROCESSED"))
+        assert len(updated) == 10
+        for job in updated:
             assert job._state == "clean"
-            assert job.state == "PREPROCESSED"
             assert job.last_update > preproc_time
             assert job.state_data is None
             assert job.state_timestamp is None
 
-    def test_children_read(self, client):
-        App = client.App
-        Site = client.Site
+    def test_children_read(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
         parent = Job("test/parent", app_id=app.id)
         parent.save()
         child = Job("test/child", app_id=app.id, parent_ids=[parent.id])
@@ -425,7 +426,7 @@ class TestJobs:
         App = client.App
         Site = client.Site
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
+        site = Site.objects.create(name="summit", path="/projects/foo")
         app = App.objects.create(
             site_id=site.id,
             name="one",
@@ -445,13 +446,10 @@ class TestJobs:
         print(t1, job.last_update)
         assert job.last_update > t1
 
-    def test_can_view_history(self, client):
-        App = client.App
-        Site = client.Site
+    def test_can_view_history(self, client, site_app):
         Job = client.Job
         EventLog = client.EventLog
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
         job = Job("test/test", app_id=app.id)
         job.save()
         history = EventLog.objects.filter(job_id=job.id)
@@ -469,24 +467,18 @@ class TestJobs:
         assert latest_event.to_state == "PREPROCESSED"
         assert latest_event.timestamp == update_time
 
-    def test_bulk_delete(self, client):
-        App = client.App
-        Site = client.Site
+    def test_bulk_delete(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="One", serialized_class="txt", source_code="txt")
+        site, app = site_app
         jobs = [Job(f"test/{i}", app_id=app.id) for i in range(3)]
         Job.objects.bulk_create(jobs)
         assert Job.objects.count() == 3
         Job.objects.all().delete()
         assert Job.objects.count() == 0
 
-    def test_filter_by_tags(self, client):
-        App = client.App
-        Site = client.Site
+    def test_filter_by_tags(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
         jobs = [Job(f"test/{i}", app_id=app.id, tags={"foo": i, "bar": i * 2}) for i in range(3)]
         Job.objects.bulk_create(jobs)
         assert Job.objects.count() == 3
@@ -496,12 +488,9 @@ class TestJobs:
         assert Job.objects.filter(tags=["foo:2", "bar:3"]).count() == 0
         assert Job.objects.filter(tags=["foo:2", "bar:4"]).count() == 1
 
-    def test_filter_by_id_list(self, client):
-        App = client.App
-        Site = client.Site
+    def test_filter_by_id_list(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
 
         foo_jobs = [Job(f"foo/{i}", app_id=app.id) for i in range(3)]
         foo_jobs = Job.objects.bulk_create(foo_jobs)
@@ -513,12 +502,9 @@ class TestJobs:
         assert Job.objects.count() == 6
         assert Job.objects.filter(id=ids).count() == 3
 
-    def test_state_ordering(self, client):
-        App = client.App
-        Site = client.Site
+    def test_state_ordering(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
         jobs = [Job(f"foo/{i}", app_id=app.id) for i in range(4)]
         jobs = Job.objects.bulk_create(jobs)
         jobs[2].state = "PREPROCESSED"
@@ -527,12 +513,9 @@ class TestJobs:
         states = [job.state for job in Job.objects.all().order_by("state")]
         assert states == ["PREPROCESSED"] + ["STAGED_IN"] * 3
 
-    def test_filter_by_workdir(self, client):
-        App = client.App
-        Site = client.Site
+    def test_filter_by_workdir(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
         jobs = [Job(f"foo/{i}", app_id=app.id) for i in range(4)]
         jobs.append(Job("bar/99", app_id=app.id))
         jobs = Job.objects.bulk_create(jobs)
@@ -589,12 +572,9 @@ class TestJobs:
         with pytest.raises(App.DoesNotExist):
             Job("test/2", app_id="AppB", site_name="theta3")
 
-    def test_filter_by_state(self, client):
-        App = client.App
-        Site = client.Site
+    def test_filter_by_state(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
 
         jobs = [Job(f"foo/{i}", app_id=app.id) for i in range(4)]
         jobs = Job.objects.bulk_create(jobs)
@@ -606,12 +586,9 @@ class TestJobs:
         assert Job.objects.filter(state__ne="STAGED_IN").count() == 1
         assert Job.objects.filter(state__ne="PREPROCESSED").count() == 3
 
-    def test_filter_by_pending_cleanup(self, client):
-        App = client.App
-        Site = client.Site
+    def test_filter_by_pending_cleanup(self, client, site_app):
         Job = client.Job
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
 
         jobs = [Job(f"foo/{i}", app_id=app.id) for i in range(4)]
         jobs = Job.objects.bulk_create(jobs)
@@ -773,13 +750,23 @@ class TestTransfers:
 
 
 class TestEvents:
-    def setup_scenario(self, client):
+    @pytest.fixture(scope="class")
+    def events_scenario(self, session_user_client):
+        """
+        Seed the Job/EventLog scenario once per class and yield the client
+        along with the seed time: every test below is read-only, so the jobs'
+        worth of history does not need re-creating between tests. Timestamp
+        assertions must be made relative to seeded_at, not the test's own
+        clock, since the seed may be arbitrarily far in the past by then.
+        """
+        client = session_user_client
         Site = client.Site
         App = client.App
         Job = client.Job
         site = Site.objects.create(name="theta", path="/projects/foo")
         app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
-        before_creation = datetime.utcnow()
+        protect_site(site.id)
+        seeded_at = datetime.utcnow()
 
         j1 = Job.objects.create(workdir="foo/1", app_id=app.id)
         j2 = Job.objects.create(workdir="foo/2", app_id=app.id)
@@ -793,7 +780,7 @@ class TestEvents:
         j2.state = "RUNNING"
         j2.save()
         j2.state = "RUN_ERROR"
-        j2.state_timestamp = datetime.utcnow() + timedelta(minutes=1)
+        j2.state_timestamp = seeded_at + timedelta(minutes=1)
         j2.save()
 
         j3.state = "PREPROCESSED"
@@ -803,10 +790,12 @@ class TestEvents:
         j3.state = "RUN_DONE"
         j3.state_data = {"message": "OK: done!"}
         j3.save()
-        return before_creation
+        yield client, seeded_at
+        unprotect_site(site.id)
+        site.delete()
 
-    def test_filter_by_job(self, client):
-        self.setup_scenario(client)
+    def test_filter_by_job(self, events_scenario):
+        client, _ = events_scenario
         Job = client.Job
         EventLog = client.EventLog
         id = Job.objects.get(workdir__contains="foo/2").id
@@ -814,40 +803,36 @@ class TestEvents:
         states = [event.to_state for event in qs]
         assert states == ["RUN_ERROR", "RUNNING", "PREPROCESSED", "STAGED_IN"]
 
-    def test_filter_by_to_state(self, client):
-        self.setup_scenario(client)
-        EventLog = client.EventLog
+    def test_filter_by_to_state(self, events_scenario):
+        EventLog = events_scenario[0].EventLog
         assert EventLog.objects.filter(to_state="RUN_ERROR").count() == 1
         assert EventLog.objects.filter(to_state="STAGED_IN").count() == 3
 
-    def test_filter_by_from_state(self, client):
-        self.setup_scenario(client)
-        EventLog = client.EventLog
+    def test_filter_by_from_state(self, events_scenario):
+        EventLog = events_scenario[0].EventLog
         assert EventLog.objects.filter(from_state="CREATED").count() == 3
 
-    def test_filter_by_to_and_from_state(self, client):
-        self.setup_scenario(client)
-        EventLog = client.EventLog
+    def test_filter_by_to_and_from_state(self, events_scenario):
+        EventLog = events_scenario[0].EventLog
         qs = EventLog.objects.filter(from_state="RUNNING").filter(to_state="RUN_ERROR")
         assert qs.count() == 1
         assert qs[0] == EventLog.objects.get(from_state="RUNNING", to_state="RUN_ERROR")
 
-    def test_filter_by_message(self, client):
-        self.setup_scenario(client)
-        EventLog = client.EventLog
+    def test_filter_by_message(self, events_scenario):
+        EventLog = events_scenario[0].EventLog
         qs = EventLog.objects.filter(data="message:OK: done!")
         assert qs.count() == 1
         assert qs[0].to_state == "RUN_DONE"
 
-    def test_filter_by_timestamp_range(self, client):
-        self.setup_scenario(client)
+    def test_filter_by_timestamp_range(self, events_scenario):
+        client, seeded_at = events_scenario
         EventLog = client.EventLog
-        t = datetime.utcnow() + timedelta(seconds=30)
+        # Only j2's RUN_ERROR event is stamped a minute past the seed time
+        t = seeded_at + timedelta(seconds=30)
         assert EventLog.objects.filter(timestamp_after=t).count() == 1
 
-    def test_cannot_create_or_update(self, client):
-        self.setup_scenario(client)
-        EventLog = client.EventLog
+    def test_cannot_create_or_update(self, events_scenario):
+        EventLog = events_scenario[0].EventLog
         with pytest.raises(AttributeError, match="has no attribute 'create'"):
             EventLog.objects.create(
                 job_id=1,
@@ -864,7 +849,7 @@ class TestBatchJobs:
     def test_create(self, client):
         Site = client.Site
         BatchJob = client.BatchJob
-        site = Site.objects.create(name="theta", path="/projects/foo")
+        site = Site.objects.create(name="summit", path="/projects/foo")
         bjob = BatchJob.objects.create(
             site_id=site.id,
             project="datascience",
@@ -880,7 +865,7 @@ class TestBatchJobs:
     def test_filter_by_scheduler_id(self, client):
         Site = client.Site
         BatchJob = client.BatchJob
-        site = Site.objects.create(name="theta", path="/projects/foo")
+        site = Site.objects.create(name="summit", path="/projects/foo")
         bjob = BatchJob.objects.create(
             site_id=site.id,
             project="datascience",
@@ -926,8 +911,8 @@ class TestBatchJobs:
     def test_bulk_update(self, client):
         Site = client.Site
         BatchJob = client.BatchJob
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        for i in range(3):
+        site = Site.objects.create(name="summit", path="/projects/foo")
+        bjobs = [
             BatchJob.objects.create(
                 site_id=site.id,
                 project="datascience",
@@ -937,10 +922,11 @@ class TestBatchJobs:
                 job_mode="mpi",
                 filter_tags={"system": "H2O", "calc_type": "energy"},
             )
+            for _ in range(3)
+        ]
 
         assert BatchJob.objects.count() == 3
 
-        bjobs = BatchJob.objects.filter(site_id=site.id)
         for job, sched_id in zip(bjobs, [123, 124, 125]):
             job.state = "queued"
             job.scheduler_id = sched_id
@@ -952,7 +938,7 @@ class TestBatchJobs:
     def test_delete(self, client):
         Site = client.Site
         BatchJob = client.BatchJob
-        site = Site.objects.create(name="theta", path="/projects/foo")
+        site = Site.objects.create(name="summit", path="/projects/foo")
         for i in range(3):
             BatchJob.objects.create(
                 site_id=site.id,
@@ -975,7 +961,7 @@ class TestBatchJobs:
     def test_filter_by_tags(self, client):
         Site = client.Site
         BatchJob = client.BatchJob
-        site = Site.objects.create(name="theta", path="/projects/foo")
+        site = Site.objects.create(name="summit", path="/projects/foo")
         for system in ["H2O", "D2O", "NH3", "CH2O"]:
             BatchJob.objects.create(
                 site_id=site.id,
@@ -989,14 +975,11 @@ class TestBatchJobs:
 
         assert BatchJob.objects.filter(filter_tags="system:NH3").count() == 1
 
-    def test_fetch_associated_jobs(self, client):
-        Site = client.Site
+    def test_fetch_associated_jobs(self, client, site_app):
         BatchJob = client.BatchJob
-        App = client.App
         Job = client.Job
         Session = client.Session
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
+        site, app = site_app
 
         batch_job = BatchJob.objects.create(
             site_id=site.id,
@@ -1025,18 +1008,11 @@ class TestBatchJobs:
         )
         assert len(acquired) == 3
 
-        related = Job.objects.filter(batch_job_id=batch_job.id)
-        assert sorted([j.id for j in related]) == sorted([j.id for j in acquired])
+        related = Job.objects.filter(batch_job_id=batch_job.id).order_by("id")
+        assert [j.id for j in related] == sorted(j.id for j in acquired)
 
 
 class TestSessions:
-    def create_site_app(self, client):
-        Site = client.Site
-        App = client.App
-        site = Site.objects.create(name="theta", path="/projects/foo")
-        app = App.objects.create(site_id=site.id, name="one", serialized_class="txt", source_code="txt")
-        return site, app
-
     def job(self, client, name, app, args={}, **kwargs):
         return client.Job(f"test/{name}", app_id=app.id, parameters=args, **kwargs)
 
@@ -1059,14 +1035,14 @@ class TestSessions:
         sess = client.Session.objects.create(batch_job_id=batch_job.id, site_id=site.id)
         return sess
 
-    def test_create(self, client):
+    def test_create(self, client, site_app):
         before_create = datetime.utcnow()
-        site = client.Site.objects.create(name="theta", path="/projects/foo")
+        site, app = site_app
         sess = self.create_sess(client, site)
         assert sess.heartbeat > before_create
 
-    def test_acquire(self, client):
-        site, app = self.create_site_app(client)
+    def test_acquire(self, client, site_app):
+        site, app = site_app
         self.create_jobs(client, app, num_jobs=3)
         sess = self.create_sess(client, site)
 
@@ -1080,8 +1056,8 @@ class TestSessions:
         for job in acquired:
             assert job.batch_job_id > 0
 
-    def test_acquire_by_app_ids(self, client):
-        site, app1 = self.create_site_app(client)
+    def test_acquire_by_app_ids(self, client, site_app):
+        site, app1 = site_app
         app2 = client.App.objects.create(site_id=site.id, name="two", serialized_class="txt", source_code="txt")
         self.create_jobs(client, app1, num_jobs=5)
         self.create_jobs(client, app2, num_jobs=5)
@@ -1095,8 +1071,8 @@ class TestSessions:
         for job in acquired:
             assert job.app_id == app2.id
 
-    def test_acquire_for_preprocessing(self, client):
-        site, app = self.create_site_app(client)
+    def test_acquire_for_preprocessing(self, client, site_app):
+        site, app = site_app
         self.create_jobs(client, app, num_jobs=10, state="STAGED_IN")
         sess = client.Session.objects.create(site_id=site.id)
         assert sess.batch_job_id is None
@@ -1110,8 +1086,8 @@ class TestSessions:
         assert len(acquired) == 10
         assert all(j.state == "STAGED_IN" for j in acquired)
 
-    def test_acquire_with_filter_tags(self, client):
-        site, app = self.create_site_app(client)
+    def test_acquire_with_filter_tags(self, client, site_app):
+        site, app = site_app
 
         job_tags = [
             dict(system="H2O", type="energy"),
@@ -1133,16 +1109,16 @@ class TestSessions:
         assert len(acquired) == 1
         assert acquired[0].tags == dict(system="H2O", type="energy")
 
-    def test_tick(self, client):
-        site = client.Site.objects.create(name="theta", path="/projects/foo")
+    def test_tick(self, client, site_app):
+        site, app = site_app
         sess = self.create_sess(client, site)
         creation_time = sess.heartbeat
         sess.tick()
         sess.refresh_from_db()
         assert sess.heartbeat > creation_time
 
-    def test_delete(self, client):
-        site, app = self.create_site_app(client)
+    def test_delete(self, client, site_app):
+        site, app = site_app
         self.create_jobs(client, app, num_jobs=3)
 
         sess = self.create_sess(client, site)
@@ -7,7 +7,7 @@ import tempfile
 import time
 from contextlib import closing
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 from uuid import uuid4
 
 import psutil  # type: ignore
@@ -26,6 +26,15 @@ from balsam.util import postgres as pg
 from .test_platform import PLATFORMS, get_platform, get_test_api_url, get_test_db_url, get_test_dir, get_test_log_dir
 
 
+def pytest_addoption(parser: Any) -> None:
+    parser.addoption(
+        "--reuse-db",
+        action="store_true",
+        default=False,
+        help="Skip alembic migrations when the test DB schema is already at head (faster re-runs).",
+    )
+
+
 def pytest_runtest_setup(item: Any) -> None:
     """
     PyTest calls this hook before each test.
@@ -38,21 +47,65 @@ def pytest_runtest_setup(item: Any) -> None:
         pytest.skip("cannot run on platform {}".format(plat))
 
 
+def _xdist_worker_id() -> Optional[str]:
+    """Worker id ("gw0", "gw1", ...) under pytest-xdist; None when running serially"""
+    return os.environ.get("PYTEST_XDIST_WORKER")
+
+
+def _create_database_if_missing(base_dsn: str, dbname: str) -> None:
+    """Create a per-xdist-worker database alongside the base test DB"""
+    import psycopg2  # type: ignore
+
+    conn = psycopg2.connect(base_dsn)
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""SELECT 1 FROM pg_database WHERE datname = %s;""", [dbname])
+            if cur.fetchone() is None:
+                cur.execute(f'CREATE DATABASE "{dbname}";')
+    finally:
+        conn.close()
+
+
+def _migrations_current(session: Any) -> bool:
+    """True if the test DB's alembic revision already matches the migration script head"""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    import balsam.server.models.alembic as alembic
+
+    alembic_cfg = Config()
+    alembic_cfg.set_main_option("script_location", str(Path(alembic.__file__).parent))
+    head = ScriptDirectory.from_config(alembic_cfg).get_current_head()
+    try:
+        current = session.execute("""SELECT version_num FROM alembic_version;""").scalar()
+    except Exception:
+        session.rollback()
+        return False
+    return bool(head) and current == head
+
+
 @pytest.fixture(scope="session")
-def setup_database() -> Optional[str]:
+def setup_database(request: Any) -> Optional[str]:
     """
     If `BALSAM_TEST_API_URL` is exported do nothing: the database is managed elsewhere.
     Otherwise, configure the Test DB and wipe it clean.
+    With `--reuse-db`, migrations are skipped when the schema is already at head.
     """
     if get_test_api_url():
         return None
     env_url = get_test_db_url()
+    if not env_url.rsplit("/", 1)[-1].endswith("test"):
+        raise RuntimeError("Database name used for testing must end with 'test'")
+    worker_id = _xdist_worker_id()
+    if worker_id:
+        env_url = f"{env_url}-{worker_id}"
+        _create_database_if_missing(get_test_db_url(), env_url.rsplit("/", 1)[-1])
     pg.configure_balsam_server_from_dsn(env_url)
     try:
         session = models.get_session()
-        if not session.engine.database.endswith("test"):  # type: ignore
-            raise RuntimeError("Database name used for testing must end with 'test'")
-        pg.run_alembic_migrations(env_url)
+        if not (request.config.getoption("--reuse-db") and _migrations_current(session)):
+            pg.run_alembic_migrations(env_url)
         session.execute("""TRUNCATE TABLE users CASCADE;""")
         session.commit()
         session.close()
@@ -80,6 +133,9 @@ def test_log_dir() -> Path:
     into this directory as well.
     """
     test_log_dir = get_test_log_dir()
+    worker_id = _xdist_worker_id()
+    if worker_id:
+        test_log_dir = test_log_dir.with_name(f"{test_log_dir.name}-{worker_id}")
     if test_log_dir.is_dir():
         shutil.rmtree(test_log_dir)
     test_log_dir.mkdir(exist_ok=False)
@@ -103,6 +159,7 @@ def live_server(setup_database: Optional[str], free_port: str, test_log_dir: Pat
     os.environ["BALSAM_LOG_DIR"] = test_log_dir.as_posix()
     os.environ["BALSAM_LOG_LEVEL"] = "DEBUG"
     os.environ["BALSAM_AUTH_LOGIN_METHODS"] = json.dumps(["password"])
+    os.environ["BALSAM_AUTH_BCRYPT_ROUNDS"] = "4"  # cheap hashes for test users
     os.environ["SERVER_PORT"] = str(free_port)
     os.environ["BALSAM_DATABASE_URL"] = setup_database
 
@@ -170,16 +227,53 @@ def client_factory(live_server: str) -> Iterable[Callable[[], BasicAuthRequestsC
             site.delete()
 
 
+_protected_site_ids: Set[int] = set()
+
+
+def protect_site(site_id: int) -> None:
+    """Register a class-scoped Site so the per-test `client` teardown leaves it in place"""
+    _protected_site_ids.add(site_id)
+
+
+def unprotect_site(site_id: int) -> None:
+    _protected_site_ids.discard(site_id)
+
+
+@pytest.fixture(scope="session")
+def session_user_client(live_server: str) -> Iterable[BasicAuthRequestsClient]:
+    """
+    A single authenticated client shared across the whole test session:
+    user registration and login run once, not once per test case.
+    """
+    client = _make_user_client(live_server)
+    yield client
+    for site in client.Site.objects.all():
+        site.delete()
+
+
 @pytest.fixture(scope="function")
-def client(client_factory: Callable[[], BasicAuthRequestsClient]) -> BasicAuthRequestsClient:
-    """Single ephemeral client (sites will be cleaned up after test case)"""
-    return client_factory()
+def client(session_user_client: BasicAuthRequestsClient) -> Iterable[BasicAuthRequestsClient]:
+    """
+    Session-scoped client; per-test data is deleted after each test case.
+    Sites registered via `protect_site` belong to class-scoped fixtures: their
+    Jobs/Sessions/BatchJobs are wiped here, but the Site itself survives.
+    """
+    yield session_user_client
+    if _protected_site_ids:
+        for sess in session_user_client.Session.objects.all():
+            sess.delete()
+        session_user_client.Job.objects.all().delete()
+        for bjob in session_user_client.BatchJob.objects.all():
+            bjob.delete()
+    for site in session_user_client.Site.objects.all():
+        if site.id not in _protected_site_ids:
+            site.delete()
 
 
 @pytest.fixture(scope="module")
 def temp_client_file() -> Iterable[str]:
     """Temporary file in ~/.balsam/_test for storing test credentials"""
-    cred_dir = balsam_home().joinpath("_test")
+    cred_dir = balsam_home().joinpath(f"_test-{_xdist_worker_id()}" if _xdist_worker_id() else "_test")
     cred_dir.mkdir(parents=True, exist_ok=False)
     with tempfile.NamedTemporaryFile(mode="w", delete=False, dir=cred_dir, suffix=".yml") as fp:
         client_path = Path(fp.name).resolve().as_posix()
@@ -1,12 +1,11 @@
 from uuid import uuid4
 
 import pytest
-from fastapi import status
 from fastapi.testclient import TestClient
 
 import balsam.server
-from balsam.client import urls
 from balsam.server import models
+from balsam.server.auth.token import create_access_token
 from balsam.server.models.crud import users
 
 from .util import BalsamTestClient
@@ -19,29 +18,39 @@ def db_session(setup_database):
     session.close()
 
 
-@pytest.fixture(scope="function")
-def fastapi_user_test_client(setup_database, db_session):
-    created_users = []
+@pytest.fixture(scope="session")
+def _created_user_ids(setup_database):
+    """
+    Collects the ids of users created across the session; deletes them all
+    in one statement at session teardown instead of once per test.
+    """
+    user_ids = []
+    yield user_ids
+    if user_ids:
+        session = models.get_session()
+        session.query(models.User).filter(models.User.id.in_(user_ids)).delete(synchronize_session=False)
+        session.commit()
+        session.close()
+
 
+@pytest.fixture(scope="function")
+def fastapi_user_test_client(setup_database, db_session, _created_user_ids):
     def _client_factory():
-        login_credentials = {"username": f"user{uuid4()}", "password": "test-password"}
-        user = users.create_user(db_session, **login_credentials)
+        # Mint the token directly: the register/login HTTP flow (and its bcrypt
+        # hash + verify) is covered once in test_auth, not paid per test.
+        user = users.create_user(db_session, username=f"user{uuid4()}", password=None)
         db_session.commit()
-        created_users.append(user)
+        _created_user_ids.append(user.id)
 
         balsam.server.settings.auth.login_methods = ["password"]
         from balsam.server.main import app
 
         client = BalsamTestClient(TestClient(app))
-        data = client.post_form(urls.PASSWORD_LOGIN, check=status.HTTP_200_OK, **login_credentials)
-        token = data["access_token"]
+        token, _ = create_access_token(user)
         client.headers.update({"Authorization": f"Bearer {token}"})
         return client
 
-    yield _client_factory
-    delete_ids = [user.id for user in created_users]
-    db_session.query(models.User).filter(models.User.id.in_(delete_ids)).delete(synchronize_session=False)
-    db_session.commit()
+    return _client_factory
 
 
 @pytest.fixture(scope="function")
@@ -16,6 +16,13 @@ def test_register(anon_client):
     assert resp["username"] == login_credentials["username"]
 
 
+def test_register_then_login(anon_client):
+    login_credentials = {"username": f"user{uuid4()}", "password": "foo"}
+    anon_client.post("/" + urls.PASSWORD_REGISTER, **login_credentials)
+    data = anon_client.post_form(urls.PASSWORD_LOGIN, check=status.HTTP_200_OK, **login_credentials)
+    assert data["access_token"]
+
+
 def test_auth_user_can_view_sites(auth_client):
     resp = auth_client.get("/sites/")
     assert resp["results"] == []
@@ -1,2 +1,6 @@
+import pytest
+
+
+@pytest.mark.skip(reason="not implemented")
 def test_blank():
     assert 1